@@ -1,33 +1,79 @@
-import requests
-from bs4 import BeautifulSoup
-import json
+import asyncio
+import html
 import os
-from datetime import datetime
+import re
+import sys
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
+import orjson
+from datetime import datetime, timezone
 
 BASE_URL = "https://siliguricollege.org.in/"
 NEWS_URL = BASE_URL + "news.php"
+MAX_CONCURRENT_FETCHES = 20
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; SiliguriNoticesScraper/1.0)",
+    "Accept-Encoding": "br, gzip",
+}
+
+# Reuse one keep-alive connection pool for every request to the college site
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+SESSION.headers.update(HEADERS)
 
+PANEL_SELECTOR = ".panel.panel-default"
+TITLE_SELECTOR = ".panel-title a"
+DATE_SELECTOR = ".panel-footer span"
 
-def get_notice_links():
+# Notice pages are only scanned for their Drive link, so skip parsing them.
+# Like a[href*="drive.google.com"], only the tag and attribute names are
+# matched case-insensitively, and commented-out markup is ignored.
+HTML_COMMENT_RE = re.compile(rb"<!--.*?-->", re.DOTALL)
+GDRIVE_RE = re.compile(rb"(?i:<a\b[^>]*?\shref)\s*=\s*"
+                       rb"""["']([^"']*drive\.google\.com[^"']*)["']""")
+
+
+def get_notice_links(validators=None):
     """
     Scrapes the news page and extracts all notice information.
+    The validators from the previous scrape are sent as a conditional GET.
     Returns:
-        list: List of dictionaries containing notice details
+        tuple: (list of notice dicts, or None if the page is unchanged,
+                dict of cache validators for the next scrape)
     """
+    validators = validators or {}
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+
     try:
-        res = requests.get(NEWS_URL, timeout=10)
+        res = SESSION.get(NEWS_URL, headers=headers, timeout=10)
         res.raise_for_status()
-        soup = BeautifulSoup(res.text, "html.parser")
+        if res.status_code == 304:
+            print("✓ News page unchanged since last scrape")
+            return None, validators
+
+        validators = {
+            "etag": res.headers.get("ETag"),
+            "last_modified": res.headers.get("Last-Modified")
+        }
+        tree = LexborHTMLParser(res.text)
 
         notices = []
-        for panel in soup.select(".panel.panel-default"):
-            title_tag = panel.select_one(".panel-title a")
-            date_tag = panel.select_one(".panel-footer span")
+        for panel in tree.css(PANEL_SELECTOR):
+            title_tag = panel.css_first(TITLE_SELECTOR)
+            date_tag = panel.css_first(DATE_SELECTOR)
 
             if title_tag:
-                link = str(title_tag.get("href", ""))
-                title = title_tag.get_text(strip=True)
-                date = date_tag.get_text(strip=True) if date_tag else None
+                link = title_tag.attributes.get("href") or ""
+                title = title_tag.text(strip=True)
+                # Many notices share a posting date, so keep one copy of each
+                date = sys.intern(
+                    date_tag.text(strip=True)) if date_tag else None
 
                 notices.append({
                     "title":
@@ -39,64 +85,114 @@ def get_notice_links():
                 })
 
         print(f"✓ Found {len(notices)} notices")
-        return notices
+        return notices, validators
 
     except requests.RequestException as e:
         print(f"✗ Error fetching notices: {e}")
-        return []
+        return [], validators
 
 
-def get_google_drive_link(notice_url):
+async def get_google_drive_link(session, notice_url):
     """
     Extracts Google Drive link from a notice page.
     Returns:
         str or None: Google Drive link if found
     """
     try:
-        res = requests.get(notice_url, timeout=10)
-        res.raise_for_status()
-        soup = BeautifulSoup(res.text, "html.parser")
-        gdrive_link = soup.select_one('a[href*="drive.google.com"]')
-        return gdrive_link["href"] if gdrive_link else None
+        async with session.get(notice_url,
+                               timeout=aiohttp.ClientTimeout(total=10)) as res:
+            res.raise_for_status()
+            body = await res.read()
+        match = GDRIVE_RE.search(HTML_COMMENT_RE.sub(b"", body))
+        if not match:
+            return None
+        return html.unescape(match.group(1).decode(errors="replace"))
 
-    except requests.RequestException as e:
-        print(f"  ✗ Error fetching Google Drive link: {e}")
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"  ✗ Error fetching Google Drive link for {notice_url}: "
+              f"{str(e) or type(e).__name__}")
         return None
 
 
+async def fetch_google_drive_links(notice_urls):
+    """
+    Fetches the Google Drive links of several notice pages concurrently.
+    Returns:
+        list: Google Drive link (or None) for each URL, in the same order
+    """
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_FETCHES)
+    async with aiohttp.ClientSession(connector=connector,
+                                     headers=HEADERS) as session:
+        results = await asyncio.gather(
+            *(get_google_drive_link(session, url) for url in notice_urls),
+            return_exceptions=True)
+
+    links = []
+    for url, result in zip(notice_urls, results):
+        if isinstance(result, BaseException):
+            print(f"  ✗ Unexpected error fetching {url}: "
+                  f"{type(result).__name__}: {result}")
+            result = None
+        links.append(result)
+    return links
+
+
 def load_existing_notices():
     """
     Loads previously saved notices from notices.json if available.
     Returns:
-        tuple: (set of URLs, list of existing notices)
+        tuple: (dict of notices keyed by URL, list of existing notices,
+                dict of cache validators from the last scrape)
     """
-    if not os.path.exists("notices.json"):
-        return set(), []
-
     try:
-        with open("notices.json", "r", encoding="utf-8") as f:
-            data = json.load(f)
-            existing_notices = data.get("notices", [])
-            print(f"Loaded notices.json with {len(existing_notices)} existing notices")
-            return {n["url"] for n in existing_notices}, existing_notices
+        with open("notices.json", "rb") as f:
+            data = orjson.loads(f.read())
+            # Keep the first (most recent) entry when a URL is repeated
+            existing_by_url = {}
+            for n in data.get("notices", []):
+                # Archived notices share a few posting dates; keep one copy
+                if n.get("date"):
+                    n["date"] = sys.intern(n["date"])
+                existing_by_url.setdefault(n["url"], n)
+            print(f"Loaded notices.json with {len(existing_by_url)} existing notices")
+            validators = {
+                "etag": data.get("etag"),
+                "last_modified": data.get("last_modified")
+            }
+            return existing_by_url, list(existing_by_url.values()), validators
+    except FileNotFoundError:
+        return {}, [], {}
     except Exception as e:
         print(f"✗ Error loading existing notices: {e}")
-        return set(), []
+        return {}, [], {}
 
 
-def save_to_json(notices, filename="notices.json"):
+def save_to_json(notices,
+                 filename="notices.json",
+                 scraped_at=None,
+                 validators=None):
     """
     Saves notices to notices.json file.
+    scraped_at defaults to the current UTC time when not given, and any
+    cache validators the news page sent are kept for the next conditional GET.
     """
     try:
         data = {
-            "scraped_at": datetime.now().isoformat(),
-            "total_notices": len(notices),
-            "notices": notices
+            "scraped_at":
+            scraped_at or datetime.now(timezone.utc).isoformat(),
+            "total_notices": len(notices)
         }
+        data.update({k: v for k, v in (validators or {}).items() if v})
+        data["notices"] = notices
 
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Write to a temporary file first so a crash never leaves a
+        # truncated notices.json behind
+        tmp_filename = filename + ".tmp"
+        with open(tmp_filename, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_filename, filename)
 
         print(f"\n✓ Data saved to {filename}")
 
@@ -110,36 +206,58 @@ def main():
     print("=" * 60)
     print(f"\nScraping from: {NEWS_URL}\n")
 
-    existing_links, existing_notices = load_existing_notices()
-    all_notices = get_notice_links()
+    scraped_at = datetime.now(timezone.utc).isoformat()
+
+    existing_by_url, existing_notices, validators = load_existing_notices()
+    all_notices, validators = get_notice_links(validators)
+
+    if all_notices is None:
+        print("\nNo new notices found. Everything is up to date.")
+        save_to_json(existing_notices,
+                     scraped_at=scraped_at,
+                     validators=validators)
+        return
 
     if not all_notices:
         print("\nNo notices found or error occurred.")
         return
 
-    # Filter new notices only
-    new_notices = [n for n in all_notices if n["url"] not in existing_links]
+    # Filter new notices only. The page is newest-first, so when a URL is
+    # listed more than once keep its first occurrence
+    new_by_url = {}
+    for n in all_notices:
+        if n["url"] not in existing_by_url:
+            new_by_url.setdefault(n["url"], n)
+    new_notices = list(new_by_url.values())
 
     if not new_notices:
         print("\nNo new notices found. Everything is up to date.")
         # Still save to update the scraped_at timestamp
-        save_to_json(existing_notices)
+        save_to_json(existing_notices,
+                     scraped_at=scraped_at,
+                     validators=validators)
         return
 
     print(
         f"\nFound {len(new_notices)} new notices. Fetching Google Drive links..."
     )
-    for i, notice in enumerate(new_notices, 1):
-        print(
-            f"[{i}/{len(new_notices)}] Processing: {notice['title'][:50]}...")
-        gdrive = get_google_drive_link(notice["url"])
+    gdrive_links = asyncio.run(
+        fetch_google_drive_links([n["url"] for n in new_notices]))
+
+    # Report every notice in one write once all fetches have finished
+    summary = []
+    for i, (notice, gdrive) in enumerate(zip(new_notices, gdrive_links), 1):
         notice["google_drive"] = gdrive
+        status = "✓" if gdrive else "✗ no Drive link:"
+        summary.append(
+            f"[{i}/{len(new_notices)}] {status} {notice['title'][:50]}...")
+    print("\n".join(summary))
 
     # Combine new notices at the beginning (most recent first) + existing notices
     combined = new_notices + existing_notices
 
     # Save to notices.json
-    save_to_json(combined)
+    save_to_json(combined, scraped_at=scraped_at, validators=validators)
 
     print("\n" + "=" * 60)
     print(f"Added {len(new_notices)} new notice(s) to notices.json.")